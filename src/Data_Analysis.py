@@ -1,13 +1,18 @@
 from tkinter.tix import COLUMN
 from numpy import column_stack
-from src.shared_objects import WordApp
+from src.shared_objects import WordApp, marshal_com_object, unmarshal_com_object
+import pythoncom
 import pandas as pd
 from customtkinter import CTkButton, CTkComboBox
 import customtkinter as ctk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import threading
 import json
 from src.utlities import collect_data
+from src.edit_queue import PendingEdits, apply_fix_groups, normalize_attribute, convert_value
+from src.edit_journal import Delta, EditJournal
+from src.data_io import FILE_TYPES, export_dataframe, import_dataframe
+from src.style_rules import RuleSet, load_rules, plan_fixes
 from src.logger import setup_logging
 
 # Setup logging
@@ -19,13 +24,18 @@ class DataFrameTab(ctk.CTkFrame):
         self.queue = queue
         self.df = None
         self.filtered_df = None
-        self.original_df = None
+        self.journal = EditJournal()
         self.filter_history = []
         self.history_file = r"Data\filter_history.json"
+        self.rules_file = r"Data\style_rules.json"
+        self.violations_df = None
+        self.rule_set = None
         self.load_filter_history()
         self.word_app = WordApp()
         self.doc = self.word_app.get_active_document()
         self.drag_data = {"item": None, "index": None}
+        self.pending_edits = PendingEdits()
+        self.flush_in_progress = False
         self.setup_ui()
         self.setup_treeview()
         self.setup_scrollbars()
@@ -47,10 +57,10 @@ class DataFrameTab(ctk.CTkFrame):
         self.filter_history_dropdown.bind("<<ComboboxSelected>>", self.load_filter_from_history)
 
 
-        self.import_button = CTkButton( self.button_frame, text="Import Data", command=self.import_from_csv)
+        self.import_button = CTkButton( self.button_frame, text="Import Data", command=self.import_data)
         self.import_button.grid(row=0, column=7, padx=5, pady=5, sticky="w")
 
-        self.export_button = CTkButton(  self.button_frame, text="Export Data", command=self.export_to_csv)
+        self.export_button = CTkButton(  self.button_frame, text="Export Data", command=self.export_data)
         self.export_button.grid(row=0, column=6, padx=5, pady=5, sticky="w")
 
         self.sort_label = ctk.CTkLabel( self.button_frame, text="Sort by:")
@@ -76,9 +86,27 @@ class DataFrameTab(ctk.CTkFrame):
         self.revert_button = CTkButton( self.button_frame, text="Revert DataFrame", command=self.revert_to_original)
         self.revert_button.grid(row=0, column=5, padx=5, pady=5, sticky="ew")
 
+        self.undo_button = CTkButton( self.button_frame, text="Undo", command=self.undo_edit)
+        self.undo_button.grid(row=2, column=5, padx=5, pady=5, sticky="ew")
+
+        self.redo_button = CTkButton( self.button_frame, text="Redo", command=self.redo_edit)
+        self.redo_button.grid(row=2, column=6, padx=5, pady=5, sticky="ew")
+
+        self.check_rules_button = CTkButton( self.button_frame, text="Check Rules", command=self.check_style_rules)
+        self.check_rules_button.grid(row=2, column=7, padx=5, pady=5, sticky="ew")
+
+        self.apply_fixes_button = CTkButton( self.button_frame, text="Apply Fixes", command=self.apply_rule_fixes)
+        self.apply_fixes_button.grid(row=3, column=7, padx=5, pady=5, sticky="ew")
+
         self.load_file_button = CTkButton( self.button_frame, text="Load Files", command=lambda: self.run_in_thread(self.load_file_for_data_frame))
         self.load_file_button.grid(row=1, column=5, columnspan=1, padx=5, pady=5, sticky="ew")
 
+        self.apply_edits_button = CTkButton( self.button_frame, text="Apply Edits", command=self.flush_pending_edits)
+        self.apply_edits_button.grid(row=1, column=6, padx=5, pady=5, sticky="ew")
+
+        self.pending_label = ctk.CTkLabel( self.button_frame, text="Pending edits: 0")
+        self.pending_label.grid(row=1, column=7, padx=5, pady=5, sticky="w")
+
         # self.progress_bar = ctk.CTkProgressBar( self.button_frame)
         # self.progress_bar.grid(row=10, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
 
@@ -174,32 +202,70 @@ class DataFrameTab(ctk.CTkFrame):
     def update_dataframe(self, row, col_index, new_value):
         para_number = self.treeview.item(row, "values")[0]
         column_name = self.treeview["columns"][col_index]
-        self.df.loc[self.df["Paragraph Number"] == int(para_number), column_name] = new_value
+        if column_name not in self.df.columns:
+            logger.warning(f"Column {column_name} is not part of the paragraph data.")
+            return
+        try:
+            new_value = convert_value(normalize_attribute(column_name), new_value)
+        except ValueError as e:
+            logger.error(f"Invalid value for {column_name}: {e}")
+            return
+        mask = self.df["Paragraph Number"] == int(para_number)
+        old_value = self.df.loc[mask, column_name].values[0]
+        self.df.loc[mask, column_name] = new_value
+        self.journal.record([Delta(int(para_number), column_name, old_value, new_value)])
         self.update_word_document(para_number, column_name, new_value)
 
     def update_word_document(self, para_number, column_name, new_value):
-        doc = self.doc 
+        """Queues an edit for the Word document; it is written when the pending edits are flushed."""
+        if normalize_attribute(column_name) is None:
+            logger.warning(f"Column {column_name} is not written back to Word.")
+            return
         para_range_data = self.df.loc[self.df["Paragraph Number"] == int(para_number), "Paragraph Range"].values[0]
-        para_range_start = para_range_data[0]
-        para_range_end = para_range_data[1]
-        para_range = doc.Range(Start=para_range_start, End=para_range_end)
-        para_range.Select()
+        self.pending_edits.add(para_number, para_range_data, column_name, new_value)
+        self.update_pending_count()
+        logger.info(f"Queued Word edit for paragraph {para_number} with {column_name}: {new_value}")
+
+    def update_pending_count(self):
+        """Shows the number of edits waiting to be written to Word."""
+        self.pending_label.configure(text=f"Pending edits: {len(self.pending_edits)}")
+
+    def run_word_job(self, job, on_done):
+        """
+        Runs job(doc, word_app) on a worker thread and calls on_done(result) on the UI thread.
+
+        The result is None if the job raised.
+        """
+        doc_stream = marshal_com_object(self.doc)
+        app_stream = marshal_com_object(self.word_app.get_word_app())
+
+        def worker():
+            pythoncom.CoInitialize()
+            result = None
+            try:
+                doc = unmarshal_com_object(doc_stream)
+                word_app = unmarshal_com_object(app_stream)
+                result = job(doc, word_app)
+            except Exception as e:
+                logger.error(f"Error in Word job {getattr(job, '__name__', job)}: {e}")
+            finally:
+                pythoncom.CoUninitialize()
+                self.after(0, lambda: on_done(result))
 
-        try:
-            if column_name == "Font Name":
-                para_range.Font.Name = new_value
-            elif column_name == "Font Size":
-                para_range.Font.Size = float(new_value)
-            elif column_name == "Paragraph Style":
-                para_range.Style = new_value
-            elif column_name == "Hanging Indent":
-                para_range.ParagraphFormat.LeftIndent = float(new_value) * 28.346
-            elif column_name == "First Line Indent":
-                para_range.ParagraphFormat.FirstLineIndent = float(new_value) * 28.346
-        except Exception as e:
-            logger.error(f"Error updating Word document for paragraph {para_number} with {column_name}: {e}")
+        threading.Thread(target=worker, daemon=True).start()
+
+    def flush_pending_edits(self):
+        """Writes all pending edits to Word on a worker thread."""
+        if self.flush_in_progress or not len(self.pending_edits):
+            return
+        self.flush_in_progress = True
+        self.apply_edits_button.configure(state="disabled")
+        self.run_word_job(self.pending_edits.flush, self.on_flush_done)
 
-        logger.info(f"Updated Word document for paragraph {para_number} with {column_name}: {new_value}")
+    def on_flush_done(self, result=None):
+        self.flush_in_progress = False
+        self.apply_edits_button.configure(state="normal")
+        self.update_pending_count()
 
 
 
@@ -228,6 +294,61 @@ class DataFrameTab(ctk.CTkFrame):
         else:
             messagebox.showwarning("No Data", "No data available to filter.")
 
+    def check_style_rules(self):
+        """Checks every rule in a rule file against the paragraph data and shows the violations."""
+        if self.df is None:
+            messagebox.showwarning("No Data", "No data available to check.")
+            return
+        file_path = filedialog.askopenfilename(title="Select Rule File", initialfile=self.rules_file, filetypes=[("Rule files", "*.json")])
+        if not file_path:
+            return
+        try:
+            rule_set = RuleSet(load_rules(file_path))
+            self.violations_df = rule_set.check(self.df)
+        except Exception as e:
+            messagebox.showerror("Rule Check Failed", f"Failed to check rules: {e}")
+            logger.error(f"Failed to check rules: {e}")
+            return
+        self.rules_file = file_path
+        self.rule_set = rule_set
+        self.filtered_df = self.violations_df
+        self.update_display()
+        logger.info(f"Found {len(self.violations_df)} violations of {len(rule_set.rules)} rules.")
+
+    def apply_rule_fixes(self):
+        """Applies the fixes of the checked rules to every violating paragraph in one Word session."""
+        if self.violations_df is None or self.violations_df.empty:
+            messagebox.showwarning("No Violations", "Check rules before applying fixes.")
+            return
+        groups = plan_fixes(self.rule_set.rules, self.violations_df, self.df)
+        if not groups:
+            messagebox.showinfo("No Fixes", "None of the violated rules define a fix.")
+            return
+        self.apply_fixes_button.configure(state="disabled")
+
+        def on_done(results):
+            self.apply_fixes_button.configure(state="normal")
+            if results is None:
+                messagebox.showerror("Apply Fixes Failed", "Failed to apply fixes. See the log for details.")
+                return
+            deltas = []
+            for group, applied in zip(groups, results):
+                if not applied:
+                    continue
+                # Update the DataFrame from what was written rather than re-reading Word
+                mask = self.df["Paragraph Number"].isin(group.paragraph_numbers)
+                for attribute, value in group.fix.items():
+                    old_values = self.df.loc[mask, ["Paragraph Number", attribute]].itertuples(index=False, name=None)
+                    deltas.extend(Delta(int(para_number), attribute, old, value) for para_number, old in old_values)
+                    self.df.loc[mask, attribute] = value
+            self.journal.record(deltas)
+            self.violations_df = self.rule_set.check(self.df)
+            self.filtered_df = self.violations_df
+            self.update_display()
+            logger.info(f"Applied {sum(results)} of {len(groups)} fix groups.")
+
+        self.run_word_job(lambda doc, word_app: apply_fix_groups(doc, word_app, groups), on_done)
+
     def sort_data(self, sort_column=None):
         if self.df is not None:
             if not sort_column:
@@ -296,7 +417,7 @@ class DataFrameTab(ctk.CTkFrame):
     def load_file_for_data_frame(self):
         data, doc = collect_data()
         self.df = pd.DataFrame(data)
-        self.original_df = self.df.copy()
+        self.journal.clear()
         self.filtered_df = self.df
         self.update_display()
         doc = self.doc 
@@ -317,10 +438,32 @@ class DataFrameTab(ctk.CTkFrame):
         thread.start()
         logger.info(f"Started thread for {target_function.__name__}")
 
+    def apply_journal_changes(self, changes):
+        """Writes journal changes to the DataFrame and queues the Word-side ones."""
+        for para_number, column_name, value in changes:
+            mask = self.df["Paragraph Number"] == para_number
+            self.df.loc[mask, column_name] = value
+            if normalize_attribute(column_name) is not None:
+                para_range_data = self.df.loc[mask, "Paragraph Range"].values[0]
+                self.pending_edits.add(para_number, para_range_data, column_name, value)
+        self.update_display()
+        self.update_pending_count()
+        self.flush_pending_edits()
+
+    def undo_edit(self):
+        if self.df is not None and self.journal.can_undo():
+            self.apply_journal_changes(self.journal.undo())
+            logger.info("Undid last edit.")
+
+    def redo_edit(self):
+        if self.df is not None and self.journal.can_redo():
+            self.apply_journal_changes(self.journal.redo())
+            logger.info("Redid last edit.")
+
     def revert_to_original(self):
-        if self.original_df is not None:
-            self.filtered_df = self.original_df.copy()
-            self.update_display()
+        if self.df is not None:
+            self.filtered_df = self.df
+            self.apply_journal_changes(self.journal.revert())
             logger.info("Reverted to original data.")
 
     def prompt_update_active_document(self):
@@ -332,11 +475,13 @@ class DataFrameTab(ctk.CTkFrame):
             self.run_in_thread(self.update_active_document)
         
 
-    def export_to_csv(self):
+    def export_data(self):
         if self.df is not None:
+            file_path = filedialog.asksaveasfilename(title="Export Data", defaultextension=".parquet", filetypes=FILE_TYPES)
+            if not file_path:
+                return
             try:
-                file_path = r"Data\exported_data.csv"
-                self.df.to_csv(file_path, index=False)
+                export_dataframe(self.df, file_path)
                 messagebox.showinfo("Export Successful", f"Data exported to {file_path}")
                 logger.info(f"Data exported to {file_path}")
             except Exception as e:
@@ -345,10 +490,13 @@ class DataFrameTab(ctk.CTkFrame):
         else:
             messagebox.showwarning("No Data", "No data available to export.")
 
-    def import_from_csv(self):
+    def import_data(self):
+        file_path = filedialog.askopenfilename(title="Import Data", filetypes=FILE_TYPES)
+        if not file_path:
+            return
         try:
-            file_path = r"Data\exported_data.csv"
-            self.df= pd.read_csv(file_path)
+            self.df = import_dataframe(file_path)
+            self.journal.clear()
             user_response = messagebox.askyesno("Update View", "Do you want to update the view with the imported data?")
             if user_response:
                 self.filtered_df = self.df
@@ -386,7 +534,6 @@ class DataFrameTab(ctk.CTkFrame):
                 logger.info(f"Copied cell content: {content}")
 
     def modify_selected_paragraphs(self):
-        doc = self.doc 
         modify_window = ctk.CTkToplevel(self)
         modify_window.title("Modify Paragraph Attributes")
         modify_window.geometry("400x250")
@@ -401,41 +548,39 @@ class DataFrameTab(ctk.CTkFrame):
             inputs[attr] = entry
 
         def submit_changes():
+            changes = {}
+            for attr, entry in inputs.items():
+                if entry.get():
+                    canonical = normalize_attribute(attr)
+                    try:
+                        changes[canonical] = convert_value(canonical, entry.get())
+                    except ValueError as e:
+                        messagebox.showerror("Error", f"Invalid value for {attr}: {e}")
+                        return
+
+            deltas = []
             selected_items = self.treeview.selection()
             for item in selected_items:
                 values = self.treeview.item(item, "values")
                 para_number = values[0]
 
                 try:
-                    para_range_data = self.df.loc[self.df["Paragraph Number"] == int(para_number), "Paragraph Range"].values[0]
-                    para_range_start = para_range_data[0]
-                    para_range_end = para_range_data[1]
-                    para_range = doc.Range(Start=para_range_start, End=para_range_end)
-                    para_range.Select()
-                    if inputs["Font Name"].get():
-                        para_range.Font.Name = inputs["Font Name"].get()
-                    if inputs["Font Size"].get():
-                        para_range.Font.Size = float(inputs["Font Size"].get())
-                    if inputs["Paragraph Style"].get():
-                        para_range.Style = inputs["Paragraph Style"].get()
-                    if inputs["Hanging Indent"].get():
-                        para_range.ParagraphFormat.LeftIndent = float(float(inputs["Hanging Indent"].get()) * 28.346)
-                    if inputs["First Line Indent"].get():
-                        para_range.ParagraphFormat.FirstLineIndent = float(float(inputs["First Line Indent"].get()) * 28.346)
-
-                    # Update DataFrame with new changes
-                    self.df.loc[self.df["Paragraph Number"] == int(para_number), "Font Name"] = para_range.Font.Name
-                    self.df.loc[self.df["Paragraph Number"] == int(para_number), "Font Size"] = para_range.Font.Size
-                    self.df.loc[self.df["Paragraph Number"] == int(para_number), "Paragraph Style"] = para_range.Style
-                    self.df.loc[self.df["Paragraph Number"] == int(para_number), "Hanging Indent"] = para_range.ParagraphFormat.LeftIndent / 28.346
-                    self.df.loc[self.df["Paragraph Number"] == int(para_number), "First Line Indent"] = para_range.ParagraphFormat.FirstLineIndent / 28.346
-
-                    logger.info(f"Applied changes to paragraph {para_number}")
+                    mask = self.df["Paragraph Number"] == int(para_number)
+                    para_range_data = self.df.loc[mask, "Paragraph Range"].values[0]
+                    for attribute, value in changes.items():
+                        self.pending_edits.add(para_number, para_range_data, attribute, value)
+                        deltas.append(Delta(int(para_number), attribute, self.df.loc[mask, attribute].values[0], value))
+                        # Update DataFrame with the values being written
+                        self.df.loc[mask, attribute] = value
+                    logger.info(f"Queued changes to paragraph {para_number}")
 
                 except Exception as e:
                     logger.error(f"Error modifying paragraph {para_number}: {e}")
 
+            self.journal.record(deltas)
             self.update_display()
+            self.update_pending_count()
+            self.flush_pending_edits()
             modify_window.destroy()
 
         submit_button = ctk.CTkButton(modify_window, text="Submit", command=submit_changes)
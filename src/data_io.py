@@ -0,0 +1,115 @@
+import ast
+import os
+import pandas as pd
+from src.logger import setup_logging
+
+logger = setup_logging()
+
+RANGE_COLUMN = "Paragraph Range"
+RANGE_START_COLUMN = "Range Start"
+RANGE_END_COLUMN = "Range End"
+SCHEMA_METADATA_KEY = b"wordaddin.range_columns"
+
+COLUMNAR_EXTENSIONS = (".parquet", ".feather", ".arrow")
+FILE_TYPES = [
+    ("Parquet", "*.parquet"),
+    ("Feather", "*.feather"),
+    ("Arrow IPC", "*.arrow"),
+    ("CSV", "*.csv"),
+]
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("pyarrow is required for Parquet/Feather/Arrow files; install it or use CSV.") from e
+    return pyarrow
+
+
+def _file_format(file_path):
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in COLUMNAR_EXTENSIONS + (".csv",):
+        raise ValueError(f"Unsupported file type: {extension}")
+    return extension
+
+
+def dataframe_to_table(df):
+    """
+    Converts the paragraph DataFrame into an Arrow table.
+
+    The "Paragraph Range" column of [start, end] pairs is stored as two int64
+    offset columns so that it survives the round trip without parsing.
+    """
+    pa = _require_pyarrow()
+    frame = df
+    if RANGE_COLUMN in df.columns:
+        starts, ends = zip(*df[RANGE_COLUMN]) if len(df) else ((), ())
+        frame = df.drop(columns=[RANGE_COLUMN]).assign(**{
+            RANGE_START_COLUMN: pd.array(starts, dtype="int64"),
+            RANGE_END_COLUMN: pd.array(ends, dtype="int64"),
+        })
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    if RANGE_COLUMN in df.columns:
+        metadata[SCHEMA_METADATA_KEY] = b"1"
+    return table.replace_schema_metadata(metadata)
+
+
+def table_to_dataframe(table):
+    """Converts an Arrow table written by `dataframe_to_table` back into the paragraph DataFrame."""
+    has_ranges = (table.schema.metadata or {}).get(SCHEMA_METADATA_KEY) == b"1"
+    if has_ranges:
+        starts = table.column(RANGE_START_COLUMN).to_pylist()
+        ends = table.column(RANGE_END_COLUMN).to_pylist()
+        table = table.drop_columns([RANGE_START_COLUMN, RANGE_END_COLUMN])
+    df = table.to_pandas()
+    if has_ranges:
+        df[RANGE_COLUMN] = list(zip(starts, ends))
+    return df
+
+
+def export_dataframe(df, file_path):
+    """
+    Writes the paragraph DataFrame to a Parquet, Feather, Arrow IPC or CSV file.
+
+    The format is chosen from the file extension. Arrow IPC and Feather files
+    are written uncompressed so that they can be memory-mapped on import.
+    """
+    extension = _file_format(file_path)
+    if extension == ".csv":
+        df.to_csv(file_path, index=False)
+    else:
+        table = dataframe_to_table(df)
+        if extension == ".parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(table, file_path)
+        else:
+            import pyarrow.feather as feather
+            feather.write_feather(table, file_path, compression="uncompressed")
+    logger.info(f"Exported {len(df)} rows to {file_path}")
+
+
+def import_dataframe(file_path):
+    """
+    Reads a file written by `export_dataframe`.
+
+    Arrow IPC and Feather files are memory-mapped so that column buffers are
+    paged in by the OS as they are used. CSV files are supported for older
+    exports; their "Paragraph Range" strings are parsed back into pairs.
+    """
+    extension = _file_format(file_path)
+    if extension == ".csv":
+        df = pd.read_csv(file_path)
+        if RANGE_COLUMN in df.columns:
+            df[RANGE_COLUMN] = [tuple(ast.literal_eval(value)) for value in df[RANGE_COLUMN]]
+    elif extension == ".parquet":
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+        df = table_to_dataframe(pq.read_table(file_path, memory_map=True))
+    else:
+        pa = _require_pyarrow()
+        with pa.memory_map(file_path, "r") as source:
+            df = table_to_dataframe(pa.ipc.open_file(source).read_all())
+    logger.info(f"Imported {len(df)} rows from {file_path}")
+    return df
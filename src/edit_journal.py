@@ -0,0 +1,78 @@
+from collections import namedtuple
+
+Delta = namedtuple("Delta", ["para_number", "column", "old", "new"])
+
+
+class EditJournal:
+    """
+    A compact history of cell edits used for multi-level undo/redo.
+
+    Each user action is recorded as a group of deltas. Only the changed cells
+    are stored, so memory grows with the number of edits rather than with the
+    size of the document.
+    """
+    def __init__(self):
+        self._groups = []
+        self._cursor = 0
+
+    def record(self, deltas):
+        """
+        Records a group of deltas as one undoable action.
+
+        Deltas whose old and new values are equal are dropped. Recording a new
+        action discards anything that could have been redone.
+
+        Parameters
+        ----------
+        deltas : iterable of Delta
+            The cell changes made by the action.
+        """
+        group = [delta for delta in deltas if delta.old != delta.new]
+        if not group:
+            return
+        del self._groups[self._cursor:]
+        self._groups.append(group)
+        self._cursor += 1
+
+    def can_undo(self):
+        return self._cursor > 0
+
+    def can_redo(self):
+        return self._cursor < len(self._groups)
+
+    def undo(self):
+        """Steps back one action and returns the (para_number, column, value) changes that restore it."""
+        if not self.can_undo():
+            return []
+        self._cursor -= 1
+        return [(d.para_number, d.column, d.old) for d in reversed(self._groups[self._cursor])]
+
+    def redo(self):
+        """Steps forward one action and returns the (para_number, column, value) changes that reapply it."""
+        if not self.can_redo():
+            return []
+        group = self._groups[self._cursor]
+        self._cursor += 1
+        return [(d.para_number, d.column, d.new) for d in group]
+
+    def revert(self):
+        """
+        Returns the changes that restore every edited cell to its original
+        value and clears the journal.
+
+        Only the earliest recorded old value of each cell is kept, so a cell
+        edited many times is restored with a single write.
+        """
+        originals = {}
+        for group in reversed(self._groups[:self._cursor]):
+            for delta in reversed(group):
+                originals[(delta.para_number, delta.column)] = delta.old
+        self.clear()
+        return [(para_number, column, value) for (para_number, column), value in originals.items()]
+
+    def clear(self):
+        self._groups = []
+        self._cursor = 0
+
+    def __len__(self):
+        return sum(len(group) for group in self._groups)
@@ -0,0 +1,215 @@
+import threading
+from collections import OrderedDict
+from src.logger import setup_logging
+
+logger = setup_logging()
+
+POINTS_PER_CM = 28.346
+
+# Grid column names and the legacy names used by the modify dialog map onto
+# the same Word-side attribute.
+ATTRIBUTE_ALIASES = {
+    "Font Name": "Font Name",
+    "Font Size": "Font Size",
+    "Paragraph Style": "Paragraph Style",
+    "Hanging Indent": "Hanging Indent (cm)",
+    "Hanging Indent (cm)": "Hanging Indent (cm)",
+    "First Line Indent": "First Line Indent (cm)",
+    "First Line Indent (cm)": "First Line Indent (cm)",
+}
+
+
+def normalize_attribute(column_name):
+    """Returns the canonical attribute name for a grid column, or None if it is not editable."""
+    return ATTRIBUTE_ALIASES.get(column_name)
+
+
+def convert_value(attribute, value):
+    """Converts a value typed into the grid into the type stored in the DataFrame."""
+    if attribute in ("Font Size", "Hanging Indent (cm)", "First Line Indent (cm)"):
+        return float(value)
+    return value
+
+
+def apply_attribute(para_range, attribute, value):
+    """Writes a single attribute to a Word range."""
+    if attribute == "Font Name":
+        para_range.Font.Name = value
+    elif attribute == "Font Size":
+        para_range.Font.Size = float(value)
+    elif attribute == "Paragraph Style":
+        para_range.Style = value
+    elif attribute == "Hanging Indent (cm)":
+        para_range.ParagraphFormat.LeftIndent = float(value) * POINTS_PER_CM
+    elif attribute == "First Line Indent (cm)":
+        para_range.ParagraphFormat.FirstLineIndent = float(value) * POINTS_PER_CM
+    else:
+        raise ValueError(f"Unsupported attribute: {attribute}")
+
+
+class WordBatch:
+    """
+    Context manager that turns off screen updating and groups all edits made
+    inside it into a single custom undo record.
+
+    Parameters
+    ----------
+    word_app : object
+        The Word Application COM object.
+    name : str, optional
+        The name shown in Word's undo list.
+    """
+    def __init__(self, word_app, name="Apply edits"):
+        self.word_app = word_app
+        self.name = name
+        self._screen_updating = None
+        self._undo_started = False
+
+    def __enter__(self):
+        try:
+            self._screen_updating = self.word_app.ScreenUpdating
+            self.word_app.ScreenUpdating = False
+        except Exception as e:
+            logger.warning(f"Could not disable screen updating: {e}")
+        try:
+            self.word_app.UndoRecord.StartCustomRecord(self.name)
+            self._undo_started = True
+        except Exception as e:
+            logger.warning(f"Could not start undo record: {e}")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._undo_started:
+            try:
+                self.word_app.UndoRecord.EndCustomRecord()
+            except Exception as e:
+                logger.warning(f"Could not end undo record: {e}")
+        if self._screen_updating is not None:
+            try:
+                self.word_app.ScreenUpdating = self._screen_updating
+            except Exception as e:
+                logger.warning(f"Could not restore screen updating: {e}")
+        return False
+
+
+class PendingEdits:
+    """
+    A thread-safe queue of grid edits waiting to be written to Word.
+
+    Repeated edits to the same paragraph and attribute are coalesced so that
+    only the last value is written when the queue is flushed.
+    """
+    def __init__(self):
+        self._edits = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, para_number, para_range, attribute, value):
+        """
+        Records an edit.
+
+        Parameters
+        ----------
+        para_number : int
+            The paragraph number the edit belongs to.
+        para_range : sequence
+            The (start, end) character offsets of the paragraph.
+        attribute : str
+            A grid column name; legacy names are normalized.
+        value : object
+            The new value.
+        """
+        canonical = normalize_attribute(attribute)
+        if canonical is None:
+            raise ValueError(f"Column '{attribute}' cannot be written to Word.")
+        key = (int(para_number), canonical)
+        with self._lock:
+            self._edits[key] = (int(para_range[0]), int(para_range[1]), value)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._edits)
+
+    def take(self):
+        """Removes and returns all pending edits as (para_number, attribute, start, end, value) tuples."""
+        with self._lock:
+            edits = [(key[0], key[1], *value) for key, value in self._edits.items()]
+            self._edits.clear()
+        return edits
+
+    def flush(self, doc, word_app, name="Apply grid edits"):
+        """
+        Writes all pending edits to the document in one batched pass.
+
+        Edits are applied in document order with screen updating off and a
+        single undo record. Edits that fail are logged and dropped.
+
+        Parameters
+        ----------
+        doc : object
+            The Word Document COM object.
+        word_app : object
+            The Word Application COM object.
+        name : str, optional
+            The name of the undo record.
+
+        Returns
+        -------
+        tuple
+            The number of edits applied and the number that failed.
+        """
+        edits = self.take()
+        if not edits:
+            return 0, 0
+        edits.sort(key=lambda edit: (edit[2], edit[1]))
+        applied = failed = 0
+        with WordBatch(word_app, name):
+            ranges = {}
+            for para_number, attribute, start, end, value in edits:
+                try:
+                    para_range = ranges.get((start, end))
+                    if para_range is None:
+                        para_range = ranges[(start, end)] = doc.Range(Start=start, End=end)
+                    apply_attribute(para_range, attribute, value)
+                    applied += 1
+                except Exception as e:
+                    failed += 1
+                    logger.error(f"Error updating Word document for paragraph {para_number} with {attribute}: {e}")
+        logger.info(f"Flushed {applied} pending edits to Word ({failed} failed)")
+        return applied, failed
+
+
+def apply_fix_groups(doc, word_app, groups, name="Apply rule fixes"):
+    """
+    Applies grouped rule fixes in one batched Word session.
+
+    Each span of a group is fetched once and every attribute of the group's
+    fix is written to it, with screen updating off and a single undo record.
+
+    Parameters
+    ----------
+    doc : object
+        The Word Document COM object.
+    word_app : object
+        The Word Application COM object.
+    groups : list of FixGroup
+        Groups produced by `style_rules.plan_fixes`.
+
+    Returns
+    -------
+    list of bool
+        Whether each group was applied completely.
+    """
+    results = []
+    with WordBatch(word_app, name):
+        for group in groups:
+            try:
+                for start, end in group.spans:
+                    span_range = doc.Range(Start=start, End=end)
+                    for attribute, value in group.fix.items():
+                        apply_attribute(span_range, attribute, value)
+                results.append(True)
+            except Exception as e:
+                logger.error(f"Error applying fix {group.fix} to paragraphs {group.paragraph_numbers}: {e}")
+                results.append(False)
+    logger.info(f"Applied {sum(results)} of {len(groups)} fix groups")
+    return results
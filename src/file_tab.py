@@ -7,14 +7,30 @@ from win32com.client import constants
 import gc
 import os
 import re
+import threading
 import tkinter as tnktr
 import customtkinter as ctk
 from tkinter import ttk, messagebox
 from src.shared_objects import WordApp
+from src.scan_cache import ScanCache
+from src.scan_workers import scan_documents
 from src.logger import setup_logging
 
 logger = setup_logging()
 
+SCAN_BACKEND = "auto"
+SCAN_WORKERS = 4
+SCAN_RECYCLE_AFTER = 20
+
+scan_cache = None
+
+def get_scan_cache():
+    """Returns the shared metadata cache, opening it on first use."""
+    global scan_cache
+    if scan_cache is None:
+        scan_cache = ScanCache()
+    return scan_cache
+
 class DocumentHandler:
     def __init__(self, word_app_instance=None):
         """
@@ -85,10 +101,25 @@ class DocumentHandler:
             logger.error(f"Error extracting document properties: {e}")
             return {}
 
-    def close_document(self, save_changes=False):
-        """Close the document after the actions are performed."""
+    def close_document(self, doc=None, save_changes=False):
+        """
+        Close the document after the actions are performed.
+
+        Parameters
+        ----------
+        doc : Document, optional
+            The document to close. Defaults to the last opened document.
+        save_changes : bool, optional
+            Whether to save the document before closing it.
+        """
         try:
-            self.word_app_instance.close_document(self.doc)
+            doc = doc or self.doc
+            if doc is None:
+                return
+            doc.Close(SaveChanges=bool(save_changes))
+            if doc is self.doc:
+                self.doc = None
+            self.word_app_instance.doc = None
         except Exception as e:
             logger.error(f"Error closing document: {e}")
 
@@ -359,48 +390,93 @@ def populate_tree(tree, directory):
     dirr = directory
     process_documents(directory, tree)
 
+def document_row_values(file, properties):
+    """Returns the TreeView values of a document row."""
+    return (
+        file,
+        properties.get('pages', 'N/A'),
+        properties.get('sections', 'N/A'),
+        "Not declared" if properties.get('headers') == 'Not declared' else "Headers",
+        properties.get('Starting_Page', 'N/A'),
+        properties.get('Ending_Page', 'N/A'),
+        "Not declared" if properties.get('footers', 'Not declared') == 'Not declared' else "Footers"
+    )
+
+def insert_document_row(tree, file, properties):
+    """Inserts a document and its header details into the TreeView."""
+    file_id = tree.insert('', 'end', values=document_row_values(file, properties))
+    insert_header_rows(tree, file_id, properties)
+    return file_id
+
+def update_document_row(tree, file_id, file, properties):
+    """Replaces the values and header details of an existing document row in place."""
+    if not tree.exists(file_id):
+        return
+    tree.item(file_id, values=document_row_values(file, properties))
+    tree.delete(*tree.get_children(file_id))
+    insert_header_rows(tree, file_id, properties)
+
+def insert_header_rows(tree, file_id, properties):
+    """Inserts the even and odd header text below a document row."""
+    headers = properties.get('headers', {})
+    if headers != 'Not declared':
+        even_header = headers.get('even', 'N/A')
+        odd_header = headers.get('odd', 'N/A')
+        if even_header or odd_header:
+            tree.insert(file_id, 'end', values=('', '', '', f'Even Header: {even_header}', '', '', ''))
+            tree.insert(file_id, 'end', values=('', '', '', f'Odd Header: {odd_header}', '', '', ''))
+
 def process_documents(directory, tree):
-    """Main function to process multiple documents and insert data into the TreeView."""
+    """
+    Main function to process multiple documents and insert data into the TreeView.
+
+    Files whose size and modification time match the scan cache are shown
+    immediately. New and modified files get a placeholder row and are scanned
+    on a background thread, which fills their rows in place as they finish.
+    """
     files = list_doc_files(directory)
     files = [f for f in files if not f.startswith('~')]
     files = sorted(files, key=custom_sort_key)
 
     tree.delete(*tree.get_children())  # Clear previous entries
 
-    word_instance = WordApp()
-    doc_handler = DocumentHandler(word_instance)
-
+    cache = get_scan_cache()
+    cached, changed = cache.reconcile(directory, files)
+    changed_set = set(changed)
+    pending = {}
     for file in files:
-        filepath = os.path.join(directory, file)
-        if not os.path.exists(filepath):
-            logger.warning(f"File not found: {filepath}")
-            continue
-
-        doc = doc_handler.open_document(filepath)
-        if doc:
-            properties = doc_handler.extract_properties(doc)
-            logger.info(properties)
-
-            file_id = tree.insert('', 'end', values=(
-                file,
-                properties.get('pages', 'N/A'),
-                properties.get('sections', 'N/A'),
-                "Not declared" if properties.get('headers') == 'Not declared' else "Headers",
-                properties.get('Starting_Page', 'N/A'),
-                properties.get('Ending_Page', 'N/A')
-            ))
-
-            headers = properties.get('headers', {})
-            if headers != 'Not declared':
-                even_header = headers.get('even', 'N/A')
-                odd_header = headers.get('odd', 'N/A')
-                if even_header or odd_header:
-                    tree.insert(file_id, 'end', values=('', '', '', f'Even Header: {even_header}', '', '', ''))
-                    tree.insert(file_id, 'end', values=('', '', '', f'Odd Header: {odd_header}', '', '', ''))
-
-            logger.info(f"Active instances of WordApp: {count_wordapp_instances()}")
-            logger.info(f"Active instances of WordApp: {count_document_instances()}")
-            doc_handler.close_document(doc)
+        if file in changed_set:
+            pending[file] = tree.insert('', 'end', values=(file, 'Scanning...', '', '', '', '', ''))
+        else:
+            insert_document_row(tree, file, cached[file])
+
+    if not pending:
+        return None
+    thread = threading.Thread(target=scan_changed_documents, args=(directory, pending, tree, cache), daemon=True)
+    thread.start()
+    return thread
+
+def scan_changed_documents(directory, pending, tree, cache):
+    """
+    Scans new or modified documents in parallel worker processes and updates
+    their placeholder rows as each one finishes.
+    """
+    files_by_path = {os.path.join(directory, file): file for file in pending}
+
+    def on_result(task):
+        file = files_by_path[task.item]
+        file_id = pending[file]
+        if task.ok and task.result:
+            properties = task.result
+            cache.put(task.item, properties)
+            logger.info(f"Scanned {file} in {task.elapsed:.2f}s: {properties}")
+        else:
+            logger.error(f"Error scanning {task.item}: {task.error}")
+            properties = {'pages': 'Error'}
+        tree.after(0, lambda: update_document_row(tree, file_id, file, properties))
+
+    scan_documents(list(files_by_path), on_result=on_result, backend=SCAN_BACKEND,
+                   workers=SCAN_WORKERS, recycle_after=SCAN_RECYCLE_AFTER)
 
 # def show_status(message):
 #     """Updates the status bar with the given message."""
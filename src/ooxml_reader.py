@@ -0,0 +1,185 @@
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from src.logger import setup_logging
+
+logger = setup_logging()
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+APP_NS = "http://schemas.openxmlformats.org/officeDocument/2006/extended-properties"
+
+DOCUMENT_PART = "word/document.xml"
+
+
+def w(tag):
+    """Returns the Clark-notation name of a WordprocessingML tag."""
+    return f"{{{W_NS}}}{tag}"
+
+
+class OoxmlUnavailable(Exception):
+    """Raised when a document cannot be read from its package and Word has to be used instead."""
+
+
+def resolve_part(source_part, target):
+    """Resolves a relationship target relative to the part that owns the relationship."""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source_part), target))
+
+
+def rels_part(part_name):
+    """Returns the name of the relationships part belonging to a part."""
+    directory, name = posixpath.split(part_name)
+    return posixpath.join(directory, "_rels", name + ".rels")
+
+
+def read_relationships(package, part_name):
+    """Returns {relationship id: (type, resolved target, target mode)} for a part."""
+    try:
+        root = ET.fromstring(package.read(rels_part(part_name)))
+    except KeyError:
+        return {}
+    relationships = {}
+    for rel in root.iter(f"{{{PKG_REL_NS}}}Relationship"):
+        mode = rel.get("TargetMode", "Internal")
+        target = rel.get("Target")
+        if mode == "Internal":
+            target = resolve_part(part_name, target)
+        relationships[rel.get("Id")] = (rel.get("Type"), target, mode)
+    return relationships
+
+
+def paragraph_text(paragraph):
+    """Returns the visible text of a w:p element."""
+    parts = []
+    for node in paragraph.iter():
+        if node.tag == w("t"):
+            parts.append(node.text or "")
+        elif node.tag == w("tab"):
+            parts.append("\t")
+        elif node.tag in (w("br"), w("cr")):
+            parts.append("\n")
+    return "".join(parts)
+
+
+def part_text(package, part_name):
+    """Returns the text of a header or footer part, one line per paragraph."""
+    root = ET.fromstring(package.read(part_name))
+    return "\r".join(paragraph_text(p) for p in root.iter(w("p"))).strip()
+
+
+def read_page_count(package):
+    """Returns the page count Word stored in docProps/app.xml when the document was last saved."""
+    try:
+        root = ET.fromstring(package.read("docProps/app.xml"))
+    except KeyError:
+        raise OoxmlUnavailable("docProps/app.xml is missing")
+    pages = root.find(f"{{{APP_NS}}}Pages")
+    if pages is None or not (pages.text or "").strip().isdigit():
+        raise OoxmlUnavailable("Page count is not recorded in docProps/app.xml")
+    return int(pages.text)
+
+
+def read_section_properties(package):
+    """Returns the w:sectPr elements of the main document in document order."""
+    sections = []
+    with package.open(DOCUMENT_PART) as source:
+        for _, element in ET.iterparse(source, events=("end",)):
+            if element.tag == w("sectPr"):
+                sections.append(element)
+    return sections
+
+
+def even_and_odd_headers(package):
+    """Returns True if the document uses different odd and even page headers."""
+    try:
+        root = ET.fromstring(package.read("word/settings.xml"))
+    except KeyError:
+        return False
+    setting = root.find(w("evenAndOddHeaders"))
+    return setting is not None and setting.get(w("val"), "true") not in ("false", "0", "off")
+
+
+def start_page(section):
+    """Returns the restart number of a section, or None if numbering continues."""
+    page_numbers = section.find(w("pgNumType"))
+    if page_numbers is None or page_numbers.get(w("start")) is None:
+        return None
+    return int(page_numbers.get(w("start")))
+
+
+def section_part_texts(package, section, reference_tag, relationships):
+    """Returns {type: text} for the header or footer references of a section."""
+    texts = {}
+    for reference in section.findall(w(reference_tag)):
+        rel = relationships.get(reference.get(f"{{{R_NS}}}id"))
+        if rel is None:
+            continue
+        try:
+            texts[reference.get(w("type"), "default")] = part_text(package, rel[1])
+        except KeyError:
+            logger.warning(f"Missing {reference_tag} part {rel[1]}")
+    return texts
+
+
+def read_docx_properties(filepath):
+    """
+    Reads the File Handling tab properties of a .docx file without Word.
+
+    Pages come from docProps/app.xml, sections and the starting page number
+    from the w:sectPr elements, and headers from the header parts referenced
+    by the first section.
+
+    Parameters
+    ----------
+    filepath : str
+        The path to the .docx file.
+
+    Returns
+    -------
+    dict
+        The same keys as DocumentHandler.extract_properties, plus 'footers'
+        and 'even_odd'.
+
+    Raises
+    ------
+    OoxmlUnavailable
+        If the package does not hold enough information, e.g. no saved page
+        count or page numbering that restarts in a later section.
+    """
+    try:
+        with zipfile.ZipFile(filepath) as package:
+            pages = read_page_count(package)
+            sections = read_section_properties(package)
+            if not sections:
+                raise OoxmlUnavailable("No section properties found")
+            if any(start_page(section) is not None for section in sections[1:]):
+                raise OoxmlUnavailable("Page numbering restarts after the first section")
+
+            relationships = read_relationships(package, DOCUMENT_PART)
+            headers = section_part_texts(package, sections[0], "headerReference", relationships)
+            footers = section_part_texts(package, sections[0], "footerReference", relationships)
+            even_odd = even_and_odd_headers(package)
+    except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+        raise OoxmlUnavailable(f"Cannot read package: {e}")
+
+    starting_page = start_page(sections[0]) or 1
+    odd_page_header = headers.get("default", "")
+    even_page_header = headers.get("even", "")
+    properties = {
+        'pages': pages,
+        'sections': len(sections),
+        'headers': 'Not declared',
+        'footers': 'Not declared' if not any(footers.values()) else footers,
+        'even_odd': even_odd,
+        'Starting_Page': starting_page,
+        'Ending_Page': starting_page + pages - 1,
+    }
+    if odd_page_header or even_page_header:
+        properties['headers'] = {
+            'even': even_page_header,
+            'odd': odd_page_header,
+        }
+    return properties
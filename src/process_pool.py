@@ -0,0 +1,121 @@
+import importlib
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
+from src.logger import setup_logging
+
+logger = setup_logging()
+
+# The backend owned by the current worker process
+_backend = None
+
+
+def resolve_backend(spec):
+    """
+    Returns the backend factory named by a "module:attribute" string.
+
+    Specs are strings rather than classes so that they can be sent to
+    spawned worker processes and swapped without touching the caller.
+    """
+    module_name, _, attribute = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def _init_worker(backend_spec, backend_kwargs):
+    global _backend
+    _backend = resolve_backend(backend_spec)(**backend_kwargs)
+    close = getattr(_backend, "close", None)
+    if close is not None:
+        # Runs when the worker exits, including when it is recycled
+        Finalize(_backend, close, exitpriority=10)
+
+
+def _run_task(method, item):
+    start = time.perf_counter()
+    result = getattr(_backend, method)(item)
+    return result, time.perf_counter() - start, os.getpid()
+
+
+class TaskResult:
+    """The outcome of one item processed by a WorkerPool."""
+    def __init__(self, item, result=None, error=None, elapsed=0.0, pid=None):
+        self.item = item
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+        self.pid = pid
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"TaskResult({self.item!r}, {status}, {self.elapsed:.3f}s)"
+
+
+class WorkerPool:
+    """
+    Runs items through a backend in isolated worker processes.
+
+    Every worker builds its own backend instance (for example its own
+    COM-initialized Word) and is replaced after `recycle_after` items so that
+    leaks in the backend cannot accumulate.
+
+    Parameters
+    ----------
+    backend_spec : str
+        "module:factory" of the backend to create in each worker.
+    workers : int, optional
+        The number of worker processes. Defaults to the CPU count, at most 4.
+    recycle_after : int, optional
+        The number of items a worker handles before it is restarted.
+    backend_kwargs : dict, optional
+        Keyword arguments passed to the backend factory.
+    """
+    def __init__(self, backend_spec, workers=None, recycle_after=25, backend_kwargs=None):
+        self.backend_spec = backend_spec
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.recycle_after = recycle_after
+        self.backend_kwargs = backend_kwargs or {}
+
+    def run(self, method, items, on_result=None, workers=None):
+        """
+        Calls backend.<method>(item) for every item and yields TaskResults as they complete.
+
+        Parameters
+        ----------
+        method : str
+            The backend method to call.
+        items : iterable
+            Picklable items, e.g. file paths.
+        on_result : callable, optional
+            Called with each TaskResult as soon as it is available.
+        workers : int, optional
+            Overrides the pool size for this run.
+        """
+        items = list(items)
+        if not items:
+            return
+        workers = min(workers or self.workers, len(items))
+        start = time.perf_counter()
+        with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.backend_spec, self.backend_kwargs),
+                max_tasks_per_child=self.recycle_after) as executor:
+            futures = {executor.submit(_run_task, method, item): item for item in items}
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    result, elapsed, pid = future.result()
+                    task_result = TaskResult(item, result, elapsed=elapsed, pid=pid)
+                except Exception as e:
+                    task_result = TaskResult(item, error=e)
+                if on_result:
+                    on_result(task_result)
+                yield task_result
+        logger.info(f"Processed {len(items)} items with {workers} workers in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,137 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from src.logger import setup_logging
+
+logger = setup_logging()
+
+DEFAULT_CACHE_PATH = os.path.join("Data", "scan_cache.sqlite")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    pages INTEGER,
+    sections INTEGER,
+    headers TEXT,
+    footers TEXT,
+    starting_page INTEGER,
+    ending_page INTEGER,
+    scanned_at REAL NOT NULL
+)
+"""
+
+
+def file_signature(path):
+    """Returns the (size, mtime_ns) pair used to detect changed files."""
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+class ScanCache:
+    """
+    A persistent store of document metadata keyed by path, size and mtime.
+
+    Parameters
+    ----------
+    db_path : str, optional
+        The SQLite database file. Defaults to Data/scan_cache.sqlite.
+    """
+    def __init__(self, db_path=DEFAULT_CACHE_PATH):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(_SCHEMA)
+
+    @staticmethod
+    def _key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def get(self, path, signature=None):
+        """
+        Returns the cached properties of a file, or None if it is not cached
+        or has changed since it was scanned.
+        """
+        try:
+            signature = signature or file_signature(path)
+        except OSError:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, pages, sections, headers, footers, starting_page, ending_page "
+                "FROM documents WHERE path = ?", (self._key(path),)).fetchone()
+        if row is None or (row[0], row[1]) != tuple(signature):
+            return None
+        return {
+            'pages': row[2],
+            'sections': row[3],
+            'headers': json.loads(row[4]),
+            'footers': json.loads(row[5]),
+            'Starting_Page': row[6],
+            'Ending_Page': row[7],
+        }
+
+    def put(self, path, properties, signature=None):
+        """Stores the properties of a file together with its current size and mtime."""
+        signature = signature or file_signature(path)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._key(path), signature[0], signature[1],
+                 properties.get('pages'), properties.get('sections'),
+                 json.dumps(properties.get('headers', 'Not declared')),
+                 json.dumps(properties.get('footers', 'Not declared')),
+                 properties.get('Starting_Page'), properties.get('Ending_Page'),
+                 time.time()))
+
+    def remove(self, paths):
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM documents WHERE path = ?", [(self._key(p),) for p in paths])
+
+    def reconcile(self, directory, files):
+        """
+        Splits the files of a directory into cached and changed ones and drops
+        entries for files that no longer exist.
+
+        Parameters
+        ----------
+        directory : str
+            The scanned directory.
+        files : list of str
+            The file names currently in the directory.
+
+        Returns
+        -------
+        tuple
+            A dict of file name to cached properties and a list of file names
+            that are new or modified and have to be scanned.
+        """
+        cached, changed = {}, []
+        for file in files:
+            properties = self.get(os.path.join(directory, file))
+            if properties is None:
+                changed.append(file)
+            else:
+                cached[file] = properties
+
+        prefix = self._key(directory).rstrip(os.sep) + os.sep
+        present = {self._key(os.path.join(directory, file)) for file in files}
+        with self._lock:
+            rows = self._conn.execute("SELECT path FROM documents WHERE path LIKE ? ESCAPE '\\'",
+                                      (prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%",)).fetchall()
+        deleted = [path for (path,) in rows if os.path.dirname(path) == prefix.rstrip(os.sep) and path not in present]
+        if deleted:
+            self.remove(deleted)
+        logger.info(f"Scan cache: {len(cached)} cached, {len(changed)} changed, {len(deleted)} deleted in {directory}")
+        return cached, changed
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,113 @@
+import os
+import time
+from src.ooxml_reader import OoxmlUnavailable, read_docx_properties
+from src.process_pool import WorkerPool
+from src.logger import setup_logging
+
+logger = setup_logging()
+
+SCAN_BACKENDS = {
+    "auto": "src.scan_workers:AutoScanBackend",
+    "ooxml": "src.scan_workers:OoxmlScanBackend",
+    "word": "src.scan_workers:WordScanBackend",
+    "fake": "src.scan_workers:FakeWordScanBackend",
+}
+
+
+class OoxmlScanBackend:
+    """Reads document properties from the .docx package only."""
+    def scan(self, filepath):
+        return read_docx_properties(filepath)
+
+
+class WordScanBackend:
+    """Reads document properties through a Word instance owned by the worker process."""
+    def __init__(self):
+        self._doc_handler = None
+
+    def _get_doc_handler(self):
+        if self._doc_handler is None:
+            # Imported here so that workers that never need Word do not load COM
+            from src.file_tab import DocumentHandler
+            from src.shared_objects import WordApp
+            self._doc_handler = DocumentHandler(WordApp(visible=False, display_alerts=False))
+        return self._doc_handler
+
+    def scan(self, filepath):
+        doc_handler = self._get_doc_handler()
+        doc = doc_handler.open_document(filepath)
+        if not doc:
+            raise IOError(f"Word could not open {filepath}")
+        try:
+            return doc_handler.extract_properties(doc)
+        finally:
+            doc_handler.close_document(doc)
+
+    def close(self):
+        if self._doc_handler is not None:
+            self._doc_handler.word_app_instance.quit_word()
+            self._doc_handler = None
+
+
+class AutoScanBackend(WordScanBackend):
+    """Reads .docx packages directly and only starts Word for files that need it."""
+    def scan(self, filepath):
+        if filepath.lower().endswith('.docx'):
+            try:
+                return read_docx_properties(filepath)
+            except OoxmlUnavailable as e:
+                logger.info(f"Falling back to Word for {filepath}: {e}")
+        return super().scan(filepath)
+
+
+class FakeWordScanBackend:
+    """
+    A stand-in for Word that needs no COM, used to test scheduling and throughput.
+
+    Parameters
+    ----------
+    latency : float, optional
+        Seconds each scan takes, imitating Word opening and paginating a file.
+    startup : float, optional
+        Seconds the backend takes to start, imitating launching Word.
+    """
+    def __init__(self, latency=0.05, startup=0.0):
+        self.latency = latency
+        time.sleep(startup)
+
+    def scan(self, filepath):
+        time.sleep(self.latency)
+        pages = max(1, os.path.getsize(filepath) // 1024)
+        return {
+            'pages': pages,
+            'sections': 1,
+            'headers': 'Not declared',
+            'Starting_Page': 1,
+            'Ending_Page': pages,
+        }
+
+
+def scan_documents(filepaths, on_result=None, backend="auto", workers=None, recycle_after=25, backend_kwargs=None):
+    """
+    Scans documents in parallel worker processes and streams the results.
+
+    Parameters
+    ----------
+    filepaths : list of str
+        The documents to scan.
+    on_result : callable, optional
+        Called with each TaskResult as soon as the document is scanned.
+    backend : str, optional
+        A key of SCAN_BACKENDS or a "module:factory" spec.
+    workers : int, optional
+        The number of worker processes.
+    recycle_after : int, optional
+        The number of documents a worker scans before it is restarted.
+
+    Returns
+    -------
+    list of TaskResult
+    """
+    pool = WorkerPool(SCAN_BACKENDS.get(backend, backend), workers=workers,
+                      recycle_after=recycle_after, backend_kwargs=backend_kwargs)
+    return list(pool.run("scan", filepaths, on_result=on_result))
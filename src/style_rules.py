@@ -0,0 +1,280 @@
+import ast
+import json
+import operator
+import re
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+from src.edit_queue import convert_value, normalize_attribute
+from src.logger import setup_logging
+
+logger = setup_logging()
+
+VIOLATION_COLUMNS = ["Paragraph Number", "Rule", "Values"]
+
+FixGroup = namedtuple("FixGroup", ["fix", "paragraph_numbers", "spans"])
+
+_BACKTICK_PATTERN = re.compile(r"`([^`]+)`")
+
+_COMPARISONS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+
+class RuleError(ValueError):
+    """Raised when a rule expression cannot be compiled."""
+
+
+class StyleRule:
+    """
+    A named house-style rule.
+
+    Parameters
+    ----------
+    name : str
+        The name shown in the violations table.
+    expression : str
+        A `DataFrame.query` style expression selecting the paragraphs that
+        violate the rule, e.g. `Paragraph Style` == "tt" and `Hanging Indent (cm)` != 7.3
+    fix : dict, optional
+        Column values that bring a violating paragraph back in line, e.g.
+        {"Paragraph Style": "tt", "Hanging Indent (cm)": 7.3}. Only columns
+        that can be written to Word are allowed.
+    """
+    def __init__(self, name, expression, fix=None):
+        self.name = name
+        self.expression = expression
+        self.fix = {}
+        for column, value in (fix or {}).items():
+            attribute = normalize_attribute(column)
+            if attribute is None:
+                raise RuleError(f"Rule '{name}' cannot fix column '{column}'.")
+            self.fix[attribute] = convert_value(attribute, value)
+
+    def __repr__(self):
+        return f"StyleRule({self.name!r}, {self.expression!r})"
+
+
+def load_rules(file_path):
+    """
+    Loads rules from a JSON file.
+
+    The file holds either a list of {"name", "expression", "fix"} objects or a
+    mapping of rule name to expression.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        content = json.load(f)
+    if isinstance(content, dict):
+        return [StyleRule(name, expression) for name, expression in content.items()]
+    return [StyleRule(item["name"], item["expression"], item.get("fix")) for item in content]
+
+
+class _Compiler:
+    """Translates rule expressions into shared expression nodes keyed by their canonical source."""
+    def __init__(self):
+        self.columns = {}
+
+    def parse(self, rule):
+        def substitute(match):
+            column = match.group(1)
+            identifier = self.columns.setdefault(column, f"__col{len(self.columns)}")
+            return identifier
+        source = _BACKTICK_PATTERN.sub(substitute, rule.expression)
+        try:
+            tree = ast.parse(source.strip(), mode="eval").body
+        except SyntaxError as e:
+            raise RuleError(f"Rule '{rule.name}' is not a valid expression: {e}") from e
+        return self.normalize(tree, rule)
+
+    def normalize(self, node, rule):
+        """Returns a hashable node description; equal sub-expressions get equal descriptions."""
+        if isinstance(node, ast.BoolOp):
+            op = "and" if isinstance(node.op, ast.And) else "or"
+            return (op,) + tuple(self.normalize(value, rule) for value in node.values)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr)):
+            op = "and" if isinstance(node.op, ast.BitAnd) else "or"
+            return (op, self.normalize(node.left, rule), self.normalize(node.right, rule))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.Invert)):
+            return ("not", self.normalize(node.operand, rule))
+        if isinstance(node, ast.Compare):
+            operands = [node.left] + node.comparators
+            parts = []
+            for left, op, right in zip(operands, node.ops, operands[1:]):
+                parts.append(("cmp", type(op).__name__, self.operand(left, rule), self.operand(right, rule)))
+            return parts[0] if len(parts) == 1 else ("and",) + tuple(parts)
+        if isinstance(node, ast.Name):
+            return ("truthy", self.operand(node, rule))
+        raise RuleError(f"Rule '{rule.name}' uses unsupported syntax: {ast.unparse(node)}")
+
+    def operand(self, node, rule):
+        if isinstance(node, ast.Name):
+            for column, identifier in self.columns.items():
+                if identifier == node.id:
+                    return ("column", column)
+            return ("column", node.id)
+        try:
+            return ("value", ast.literal_eval(node))
+        except ValueError:
+            raise RuleError(f"Rule '{rule.name}' uses unsupported operand: {ast.unparse(node)}")
+
+
+def _freeze(value):
+    return tuple(value) if isinstance(value, list) else value
+
+
+class RuleSet:
+    """
+    A set of rules compiled together and evaluated in one vectorized pass.
+
+    Every distinct sub-expression, across all rules, is evaluated at most once
+    per check, so rules that share conditions share the work.
+    """
+    def __init__(self, rules):
+        self.rules = list(rules)
+        compiler = _Compiler()
+        self._programs = [self._freeze_node(compiler.parse(rule)) for rule in self.rules]
+        self._rule_columns = [sorted(self._columns_of(program)) for program in self._programs]
+
+    def _freeze_node(self, node):
+        if node[0] == "value":
+            # Keep the type in the key so that 1, 1.0 and True do not share a cache entry
+            value = _freeze(node[1])
+            return ("value", value, type(value).__name__)
+        return tuple(self._freeze_node(part) if isinstance(part, tuple) else part for part in node)
+
+    def _columns_of(self, node):
+        if node[0] == "column":
+            return {node[1]}
+        if node[0] == "value":
+            return set()
+        columns = set()
+        for part in node[1:]:
+            if isinstance(part, tuple):
+                columns |= self._columns_of(part)
+        return columns
+
+    def _evaluate(self, node, df, cache):
+        if node in cache:
+            return cache[node]
+        kind = node[0]
+        if kind == "column":
+            if node[1] not in df.columns:
+                raise RuleError(f"Unknown column: {node[1]}")
+            result = df[node[1]].to_numpy()
+        elif kind == "value":
+            result = node[1]
+        elif kind == "truthy":
+            result = np.asarray(self._evaluate(node[1], df, cache), dtype=bool)
+        elif kind == "not":
+            result = ~self._evaluate(node[1], df, cache)
+        elif kind in ("and", "or"):
+            combine = np.logical_and if kind == "and" else np.logical_or
+            result = self._evaluate(node[1], df, cache)
+            for part in node[2:]:
+                result = combine(result, self._evaluate(part, df, cache))
+        elif kind == "cmp":
+            result = self._compare(node[1], self._evaluate(node[2], df, cache), self._evaluate(node[3], df, cache))
+        else:
+            raise RuleError(f"Unknown node: {kind}")
+        cache[node] = result
+        return result
+
+    @staticmethod
+    def _compare(op_name, left, right):
+        if op_name in ("In", "NotIn"):
+            values = right if isinstance(right, (tuple, list, set)) else [right]
+            result = pd.Series(left).isin(values).to_numpy()
+            return ~result if op_name == "NotIn" else result
+        op = _COMPARISONS.get(getattr(ast, op_name))
+        if op is None:
+            raise RuleError(f"Unsupported comparison: {op_name}")
+        result = op(left, right)
+        return np.asarray(result, dtype=bool)
+
+    def evaluate(self, df):
+        """Returns a dict of rule name to boolean violation mask."""
+        cache = {}
+        masks = {}
+        for rule, program in zip(self.rules, self._programs):
+            mask = self._evaluate(program, df, cache)
+            masks[rule.name] = np.broadcast_to(np.asarray(mask, dtype=bool), (len(df),))
+        logger.info(f"Evaluated {len(self.rules)} rules using {len(cache)} shared sub-expressions")
+        return masks
+
+    def check(self, df):
+        """
+        Evaluates every rule against the paragraph DataFrame.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per violation with the paragraph number, the rule name and
+            the values of the columns the rule looks at.
+        """
+        masks = self.evaluate(df)
+        frames = []
+        for rule, columns in zip(self.rules, self._rule_columns):
+            hits = df.loc[masks[rule.name], ["Paragraph Number"] + columns]
+            if hits.empty:
+                continue
+            values = None
+            for column in columns:
+                part = f"{column}=" + hits[column].astype(str)
+                values = part if values is None else values + "; " + part
+            frames.append(pd.DataFrame({
+                "Paragraph Number": hits["Paragraph Number"].to_numpy(),
+                "Rule": rule.name,
+                "Values": values.to_numpy() if values is not None else "",
+            }))
+        if not frames:
+            return pd.DataFrame(columns=VIOLATION_COLUMNS)
+        return pd.concat(frames, ignore_index=True)
+
+
+def plan_fixes(rules, violations, df):
+    """
+    Groups the paragraphs in a violations table by the fix that applies to them.
+
+    When a paragraph violates several rules their fixes are merged in rule
+    order. Paragraphs that share an identical fix and sit next to each other
+    in the document are merged into a single span, so each group can be
+    written with as few Word calls as possible.
+
+    Returns
+    -------
+    list of FixGroup
+    """
+    fixes_by_rule = {rule.name: rule.fix for rule in rules if rule.fix}
+    merged = {}
+    for para_number, rule_name in zip(violations["Paragraph Number"], violations["Rule"]):
+        fix = fixes_by_rule.get(rule_name)
+        if fix:
+            merged.setdefault(int(para_number), {}).update(fix)
+    if not merged:
+        return []
+
+    affected = df[df["Paragraph Number"].isin(list(merged))]
+    ranges = dict(zip(affected["Paragraph Number"].tolist(), affected["Paragraph Range"]))
+
+    paragraphs_by_fix = {}
+    for para_number, fix in merged.items():
+        paragraphs_by_fix.setdefault(tuple(sorted(fix.items())), []).append(para_number)
+
+    groups = []
+    for key, paragraph_numbers in paragraphs_by_fix.items():
+        paragraph_numbers.sort()
+        spans = []
+        for para_number in paragraph_numbers:
+            start, end = int(ranges[para_number][0]), int(ranges[para_number][1])
+            if spans and spans[-1][1] == start:
+                spans[-1][1] = end
+            else:
+                spans.append([start, end])
+        groups.append(FixGroup(dict(key), paragraph_numbers, [tuple(span) for span in spans]))
+    logger.info(f"Planned fixes for {len(merged)} paragraphs in {len(groups)} groups")
+    return groups
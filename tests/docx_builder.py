@@ -0,0 +1,81 @@
+"""Builds minimal .docx packages for tests."""
+import zipfile
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+HEADER_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/header"
+FOOTER_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/footer"
+STYLES_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles"
+SETTINGS_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings"
+
+
+def paragraph(text, style=None):
+    style_xml = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return f'<w:p>{style_xml}<w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+
+
+def section(headers=None, footers=None, start=None):
+    """Returns a w:sectPr; headers/footers map a type ('default', 'even') to a relationship id."""
+    references = "".join(f'<w:headerReference w:type="{kind}" r:id="{rid}"/>' for kind, rid in (headers or {}).items())
+    references += "".join(f'<w:footerReference w:type="{kind}" r:id="{rid}"/>' for kind, rid in (footers or {}).items())
+    page_numbers = f'<w:pgNumType w:start="{start}"/>' if start is not None else ""
+    return f'<w:sectPr>{references}<w:pgSz w:w="11906" w:h="16838"/>{page_numbers}</w:sectPr>'
+
+
+def build_docx(path, body, pages=None, headers=None, footers=None, even_and_odd=False, styles=None, extra_parts=None):
+    """
+    Writes a .docx package.
+
+    Parameters
+    ----------
+    body : str
+        The XML inside w:body, including the final w:sectPr.
+    headers, footers : dict
+        Relationship id -> XML of the w:hdr / w:ftr part body.
+    styles : str
+        XML placed inside w:styles.
+    extra_parts : dict
+        Part name -> bytes or str for additional parts (media, header rels).
+    """
+    headers = headers or {}
+    footers = footers or {}
+    overrides = ['<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>',
+                 '<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>',
+                 '<Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>']
+    rels = [f'<Relationship Id="rIdStyles" Type="{STYLES_TYPE}" Target="styles.xml"/>',
+            f'<Relationship Id="rIdSettings" Type="{SETTINGS_TYPE}" Target="settings.xml"/>']
+    parts = {}
+    for kind, items, rel_type, root in (("header", headers, HEADER_TYPE, "hdr"), ("footer", footers, FOOTER_TYPE, "ftr")):
+        for index, (rid, xml) in enumerate(items.items(), start=1):
+            name = f"{kind}{index}.xml"
+            parts[f"word/{name}"] = f'<w:{root} xmlns:w="{W_NS}" xmlns:r="{R_NS}">{xml}</w:{root}>'
+            rels.append(f'<Relationship Id="{rid}" Type="{rel_type}" Target="{name}"/>')
+            overrides.append(f'<Override PartName="/word/{name}" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.{kind}+xml"/>')
+
+    with zipfile.ZipFile(path, "w") as package:
+        package.writestr("[Content_Types].xml",
+                         '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                         '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                         '<Default Extension="xml" ContentType="application/xml"/>'
+                         + "".join(overrides) + '</Types>')
+        package.writestr("_rels/.rels",
+                         '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                         '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+                         '</Relationships>')
+        if pages is not None:
+            package.writestr("docProps/app.xml",
+                             '<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties">'
+                             f'<Pages>{pages}</Pages></Properties>')
+        package.writestr("word/document.xml",
+                         f'<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}"><w:body>{body}</w:body></w:document>')
+        package.writestr("word/_rels/document.xml.rels",
+                         '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                         + "".join(rels) + '</Relationships>')
+        package.writestr("word/styles.xml", f'<w:styles xmlns:w="{W_NS}">{styles or ""}</w:styles>')
+        settings = '<w:evenAndOddHeaders/>' if even_and_odd else ''
+        package.writestr("word/settings.xml", f'<w:settings xmlns:w="{W_NS}">{settings}</w:settings>')
+        for name, content in parts.items():
+            package.writestr(name, content)
+        for name, content in (extra_parts or {}).items():
+            package.writestr(name, content)
+    return path
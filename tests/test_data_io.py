@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from src.data_io import export_dataframe, import_dataframe
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def make_frame():
+    df = pd.DataFrame({
+        "Paragraph Number": [1, 2],
+        "Paragraph Style": ["Normal", "tt"],
+        "Hanging Indent (cm)": [0.0, 7.3],
+        "Within Table": [False, True],
+    })
+    df["Paragraph Range"] = [(0, 5), (5, 12)]
+    return df
+
+
+class TestDataIO(unittest.TestCase):
+    def round_trip(self, extension):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "export" + extension)
+            export_dataframe(make_frame(), path)
+            return import_dataframe(path)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow not installed")
+    def test_columnar_round_trip_preserves_types(self):
+        for extension in (".parquet", ".feather", ".arrow"):
+            df = self.round_trip(extension)
+            self.assertEqual(list(df.columns), list(make_frame().columns))
+            self.assertEqual(df["Paragraph Range"].tolist(), [(0, 5), (5, 12)])
+            self.assertEqual(df["Within Table"].dtype, bool)
+            self.assertEqual(df["Hanging Indent (cm)"].tolist(), [0.0, 7.3])
+
+    def test_csv_round_trip_parses_ranges(self):
+        df = self.round_trip(".csv")
+        self.assertEqual(df["Paragraph Range"].tolist(), [(0, 5), (5, 12)])
+
+    def test_rejects_unknown_extension(self):
+        with self.assertRaises(ValueError):
+            export_dataframe(make_frame(), "export.xlsx")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from src.edit_journal import Delta, EditJournal
+
+
+class TestEditJournal(unittest.TestCase):
+    def setUp(self):
+        self.journal = EditJournal()
+        self.journal.record([Delta(1, "Font Name", "Calibri", "Arial")])
+        self.journal.record([Delta(1, "Font Name", "Arial", "Times"), Delta(2, "Font Size", 11.0, 12.0)])
+
+    def test_multi_level_undo_redo(self):
+        self.assertEqual(self.journal.undo(), [(2, "Font Size", 11.0), (1, "Font Name", "Arial")])
+        self.assertEqual(self.journal.undo(), [(1, "Font Name", "Calibri")])
+        self.assertEqual(self.journal.undo(), [])
+        self.assertEqual(self.journal.redo(), [(1, "Font Name", "Arial")])
+
+    def test_new_edit_discards_redo(self):
+        self.journal.undo()
+        self.journal.record([Delta(3, "Paragraph Style", "Normal", "tt")])
+        self.assertFalse(self.journal.can_redo())
+        self.assertEqual(len(self.journal), 2)
+
+    def test_revert_restores_first_old_value(self):
+        changes = sorted(self.journal.revert())
+        self.assertEqual(changes, [(1, "Font Name", "Calibri"), (2, "Font Size", 11.0)])
+        self.assertFalse(self.journal.can_undo())
+
+    def test_revert_ignores_undone_actions(self):
+        self.journal.undo()
+        self.assertEqual(self.journal.revert(), [(1, "Font Name", "Calibri")])
+
+
+if __name__ == "__main__":
+    unittest.main()
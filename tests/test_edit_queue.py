@@ -0,0 +1,72 @@
+import unittest
+from types import SimpleNamespace
+from src.edit_queue import PendingEdits
+
+
+class FakeRange:
+    def __init__(self, log, start, end):
+        self.Start = start
+        self.End = end
+        self.Font = SimpleNamespace(Name=None, Size=None)
+        self.ParagraphFormat = SimpleNamespace(LeftIndent=None, FirstLineIndent=None)
+        self.Style = None
+        log.append((start, end))
+
+
+class FakeUndoRecord:
+    def __init__(self):
+        self.records = []
+
+    def StartCustomRecord(self, name):
+        self.records.append(("start", name))
+
+    def EndCustomRecord(self):
+        self.records.append(("end",))
+
+
+class FakeDoc:
+    def __init__(self):
+        self.range_calls = []
+        self.ranges = []
+
+    def Range(self, Start, End):
+        rng = FakeRange(self.range_calls, Start, End)
+        self.ranges.append(rng)
+        return rng
+
+
+class TestPendingEdits(unittest.TestCase):
+    def test_coalesces_repeated_edits(self):
+        edits = PendingEdits()
+        edits.add(3, [10, 20], "Font Name", "Arial")
+        edits.add(3, [10, 20], "Font Name", "Calibri")
+        edits.add(3, [10, 20], "Hanging Indent", 1.0)
+        edits.add(3, [10, 20], "Hanging Indent (cm)", 2.0)
+        self.assertEqual(len(edits), 2)
+
+    def test_flush_applies_in_one_batch(self):
+        edits = PendingEdits()
+        edits.add(2, [30, 40], "Font Size", "12")
+        edits.add(1, [0, 10], "Paragraph Style", "tt")
+        edits.add(1, [0, 10], "Font Name", "Arial")
+        doc = FakeDoc()
+        word_app = SimpleNamespace(ScreenUpdating=True, UndoRecord=FakeUndoRecord())
+
+        applied, failed = edits.flush(doc, word_app)
+
+        self.assertEqual((applied, failed), (3, 0))
+        self.assertEqual(doc.range_calls, [(0, 10), (30, 40)])
+        self.assertEqual(doc.ranges[0].Style, "tt")
+        self.assertEqual(doc.ranges[0].Font.Name, "Arial")
+        self.assertEqual(doc.ranges[1].Font.Size, 12.0)
+        self.assertEqual(word_app.UndoRecord.records, [("start", "Apply grid edits"), ("end",)])
+        self.assertTrue(word_app.ScreenUpdating)
+        self.assertEqual(len(edits), 0)
+
+    def test_rejects_read_only_columns(self):
+        with self.assertRaises(ValueError):
+            PendingEdits().add(1, [0, 1], "Character Count", 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from src.ooxml_reader import OoxmlUnavailable, read_docx_properties
+from tests.docx_builder import build_docx, paragraph, section
+
+
+class TestReadDocxProperties(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_reads_pages_sections_headers(self):
+        first_section = section(headers={"default": "rIdH1", "even": "rIdH2"}, footers={"default": "rIdF1"}, start=41)
+        body = paragraph("Intro") + f"<w:p><w:pPr>{first_section}</w:pPr></w:p>" + paragraph("Body") + section()
+        path = build_docx(self.path("unit 1.docx"), body, pages=12,
+                          headers={"rIdH1": paragraph("Odd title"), "rIdH2": paragraph("Even title")},
+                          footers={"rIdF1": paragraph("")}, even_and_odd=True)
+
+        properties = read_docx_properties(path)
+
+        self.assertEqual(properties["pages"], 12)
+        self.assertEqual(properties["sections"], 2)
+        self.assertEqual(properties["headers"], {"even": "Even title", "odd": "Odd title"})
+        self.assertEqual(properties["footers"], "Not declared")
+        self.assertTrue(properties["even_odd"])
+        self.assertEqual((properties["Starting_Page"], properties["Ending_Page"]), (41, 52))
+
+    def test_headers_not_declared(self):
+        path = build_docx(self.path("plain.docx"), paragraph("Text") + section(), pages=3)
+        properties = read_docx_properties(path)
+        self.assertEqual(properties["headers"], "Not declared")
+        self.assertEqual((properties["Starting_Page"], properties["Ending_Page"]), (1, 3))
+
+    def test_missing_page_count_needs_word(self):
+        path = build_docx(self.path("no-app.docx"), paragraph("Text") + section())
+        with self.assertRaises(OoxmlUnavailable):
+            read_docx_properties(path)
+
+    def test_not_a_package_needs_word(self):
+        path = self.path("old.docx")
+        with open(path, "wb") as f:
+            f.write(b"\xd0\xcf\x11\xe0 not a zip")
+        with self.assertRaises(OoxmlUnavailable):
+            read_docx_properties(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
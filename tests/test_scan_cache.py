@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from src.scan_cache import ScanCache
+
+PROPERTIES = {
+    'pages': 12,
+    'sections': 2,
+    'headers': {'even': 'Even', 'odd': 'Odd'},
+    'footers': 'Not declared',
+    'Starting_Page': 5,
+    'Ending_Page': 16,
+}
+
+
+class TestScanCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ScanCache(os.path.join(self.tmp.name, "cache", "scan.sqlite"))
+        self.folder = os.path.join(self.tmp.name, "chapters")
+        os.makedirs(self.folder)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def write(self, name, content=b"data"):
+        path = os.path.join(self.folder, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_round_trip(self):
+        path = self.write("Unit 1.docx")
+        self.cache.put(path, PROPERTIES)
+        self.assertEqual(self.cache.get(path), PROPERTIES)
+
+    def test_modified_file_is_stale(self):
+        path = self.write("Unit 1.docx")
+        self.cache.put(path, PROPERTIES)
+        self.write("Unit 1.docx", b"changed content")
+        self.assertIsNone(self.cache.get(path))
+
+    def test_reconcile_splits_and_drops_deleted(self):
+        kept = self.write("Unit 1.docx")
+        gone = self.write("Unit 2.docx")
+        self.cache.put(kept, PROPERTIES)
+        self.cache.put(gone, PROPERTIES)
+        os.remove(gone)
+        self.write("Unit 3.docx")
+
+        cached, changed = self.cache.reconcile(self.folder, ["Unit 1.docx", "Unit 3.docx"])
+
+        self.assertEqual(list(cached), ["Unit 1.docx"])
+        self.assertEqual(changed, ["Unit 3.docx"])
+        remaining = self.cache._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        self.assertEqual(remaining, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import time
+import unittest
+from src.scan_workers import scan_documents
+
+
+class TestScanDocuments(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.files = []
+        for index in range(8):
+            path = os.path.join(self.tmp.name, f"Unit {index}.docx")
+            with open(path, "wb") as f:
+                f.write(b"x" * 2048 * (index + 1))
+            self.files.append(path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_streams_results_from_parallel_workers(self):
+        streamed = []
+        start = time.perf_counter()
+        results = scan_documents(self.files, on_result=streamed.append, backend="fake", workers=4,
+                                 backend_kwargs={"latency": 0.3})
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(streamed), 8)
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual({result.item for result in results}, set(self.files))
+        self.assertEqual(results[0].result["pages"], int(os.path.basename(results[0].item)[5]) * 2 + 2)
+        # Sequential scanning would take at least 8 * 0.3s
+        self.assertLess(elapsed, 8 * 0.3)
+
+    def test_workers_are_recycled(self):
+        results = scan_documents(self.files[:6], backend="fake", workers=1, recycle_after=2,
+                                 backend_kwargs={"latency": 0})
+        self.assertEqual(len({result.pid for result in results}), 3)
+
+    def test_errors_are_reported_per_file(self):
+        missing = os.path.join(self.tmp.name, "missing.docx")
+        results = scan_documents([self.files[0], missing], backend="fake", workers=2,
+                                 backend_kwargs={"latency": 0})
+        by_item = {result.item: result for result in results}
+        self.assertTrue(by_item[self.files[0]].ok)
+        self.assertIsInstance(by_item[missing].error, OSError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import pandas as pd
+from src.style_rules import RuleError, RuleSet, StyleRule, plan_fixes
+
+
+def make_frame():
+    return pd.DataFrame({
+        "Paragraph Number": [1, 2, 3, 4],
+        "Paragraph Style": ["tt", "tt", "Normal", "M1l"],
+        "Hanging Indent (cm)": [7.3, 6.0, 0.0, 1.0],
+        "Character Count": [10, 20, 2, 30],
+        "Within Table": [False, False, False, True],
+        "Paragraph Range": [(0, 10), (10, 25), (25, 30), (30, 60)],
+    })
+
+
+class TestRuleSet(unittest.TestCase):
+    def test_reports_violations_per_rule(self):
+        rules = RuleSet([
+            StyleRule("tt indent", '`Paragraph Style` == "tt" and `Hanging Indent (cm)` != 7.3'),
+            StyleRule("short body", '`Within Table` == False and `Character Count` < 5'),
+            StyleRule("table styles", '`Within Table` and `Paragraph Style` not in ["tt", "Normal"]'),
+        ])
+        violations = rules.check(make_frame())
+        self.assertEqual(violations["Paragraph Number"].tolist(), [2, 3, 4])
+        self.assertEqual(violations["Rule"].tolist(), ["tt indent", "short body", "table styles"])
+        self.assertEqual(violations["Values"].iloc[0], "Hanging Indent (cm)=6.0; Paragraph Style=tt")
+
+    def test_matches_query_semantics(self):
+        expression = '(`Character Count` > 5 or `Paragraph Style` == "Normal") and not `Within Table`'
+        masks = RuleSet([StyleRule("r", expression)]).evaluate(make_frame())
+        expected = make_frame().eval(expression).to_numpy()
+        self.assertEqual(masks["r"].tolist(), expected.tolist())
+
+    def test_rejects_unsupported_syntax(self):
+        with self.assertRaises(RuleError):
+            RuleSet([StyleRule("call", '`Paragraph Style`.str.len() > 2')])
+
+    def test_no_violations_gives_empty_table(self):
+        violations = RuleSet([StyleRule("none", '`Character Count` > 100')]).check(make_frame())
+        self.assertTrue(violations.empty)
+        self.assertEqual(list(violations.columns), ["Paragraph Number", "Rule", "Values"])
+
+
+class TestPlanFixes(unittest.TestCase):
+    def test_groups_adjacent_paragraphs_with_identical_fix(self):
+        rules = [
+            StyleRule("tt", '`Paragraph Style` != "M1l"', fix={"Paragraph Style": "tt", "Hanging Indent (cm)": "7.3"}),
+            StyleRule("table", '`Within Table`', fix={"Font Size": 9}),
+            StyleRule("report only", '`Character Count` > 0'),
+        ]
+        rule_set = RuleSet(rules)
+        groups = plan_fixes(rule_set.rules, rule_set.check(make_frame()), make_frame())
+        self.assertEqual(len(groups), 2)
+        tt_group = next(group for group in groups if "Paragraph Style" in group.fix)
+        self.assertEqual(tt_group.fix, {"Paragraph Style": "tt", "Hanging Indent (cm)": 7.3})
+        self.assertEqual(tt_group.paragraph_numbers, [1, 2, 3])
+        self.assertEqual(tt_group.spans, [(0, 30)])
+
+    def test_rejects_fix_for_read_only_column(self):
+        with self.assertRaises(RuleError):
+            StyleRule("bad", '`Character Count` > 5', fix={"Character Count": 5})
+
+
+if __name__ == "__main__":
+    unittest.main()